@@ -9,11 +9,13 @@ This module provides the command-line interface and main application logic.
 import argparse
 import json
 import sys
+from types import MappingProxyType
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, List, Tuple
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from typing import Dict, List, Mapping, Tuple
 from chemical_compound import ChemicalCompound
-from reaction import Reaction, ReactionSystem
+from reaction import Reaction, ReactionSystem, INTEGRATORS
 
 
 class ChemicalCalculator:
@@ -23,9 +25,41 @@ class ChemicalCalculator:
     
     def __init__(self):
         """Initialize the calculator."""
-        self.compounds = {}
+        # Compounds are stored as parallel arrays indexed by position
+        self._index: Dict[str, int] = {}
+        self._compounds_list: List[ChemicalCompound] = []
+        # _conc is a view of the first len(_compounds_list) entries of a buffer
+        # that grows geometrically, so adding compounds is amortized O(1)
+        self._conc_buffer = np.zeros(16, dtype=np.float64)
+        self._conc = self._conc_buffer[:0]
         self.reactions = []
     
+    @property
+    def compounds(self) -> Mapping[str, Mapping]:
+        """
+        Compounds keyed by formula, each as {'compound': ..., 'concentration': ...}.
+        
+        This is a read-only snapshot built from the parallel arrays; use
+        set_concentration to change a concentration.
+        """
+        return MappingProxyType({
+            compound.formula: MappingProxyType({'compound': compound,
+                                                'concentration': float(self._conc[i])})
+            for i, compound in enumerate(self._compounds_list)
+        })
+    
+    def set_concentration(self, formula: str, concentration: float):
+        """
+        Set the initial concentration of an existing compound.
+        
+        Args:
+            formula (str): Chemical formula
+            concentration (float): Initial concentration in mol/L
+        """
+        if formula not in self._index:
+            raise KeyError(f"Unknown compound: {formula}")
+        self._conc[self._index[formula]] = concentration
+    
     def add_compound(self, formula: str, name: str = None, concentration: float = 0.0) -> ChemicalCompound:
         """
         Add a chemical compound to the system.
@@ -40,10 +74,20 @@ class ChemicalCalculator:
         """
         compound = ChemicalCompound(formula, name)
         compound.calculate_molar_mass()
-        self.compounds[formula] = {
-            'compound': compound,
-            'concentration': concentration
-        }
+        if formula in self._index:
+            i = self._index[formula]
+            self._compounds_list[i] = compound
+            self._conc[i] = concentration
+        else:
+            n = len(self._compounds_list)
+            if n == self._conc_buffer.size:
+                buffer = np.zeros(2 * n, dtype=np.float64)
+                buffer[:n] = self._conc_buffer
+                self._conc_buffer = buffer
+            self._conc_buffer[n] = concentration
+            self._conc = self._conc_buffer[:n + 1]
+            self._index[formula] = n
+            self._compounds_list.append(compound)
         return compound
     
     def add_reaction(self, reactant_formulas: List[str], reactant_coeffs: List[int],
@@ -67,71 +111,111 @@ class ChemicalCalculator:
         
         # Build reactants dictionary
         for formula, coeff in zip(reactant_formulas, reactant_coeffs):
-            if formula not in self.compounds:
+            if formula not in self._index:
                 self.add_compound(formula)
-            reactants[self.compounds[formula]['compound']] = coeff
+            reactants[self._compounds_list[self._index[formula]]] = coeff
         
         # Build products dictionary
         for formula, coeff in zip(product_formulas, product_coeffs):
-            if formula not in self.compounds:
+            if formula not in self._index:
                 self.add_compound(formula)
-            products[self.compounds[formula]['compound']] = coeff
+            products[self._compounds_list[self._index[formula]]] = coeff
         
         reaction = Reaction(reactants, products, rate_constant)
         self.reactions.append(reaction)
         return reaction
     
-    def simulate_reactions(self, time_end: float, time_steps: int = 1000) -> Tuple[List[float], Dict]:
+    def simulate_reactions(self, time_end: float, time_steps: int = 1000,
+                           integrator: str = 'lsoda') -> Tuple[np.ndarray, Dict]:
         """
         Simulate all reactions over time.
         
         Args:
             time_end (float): End time for simulation (seconds)
             time_steps (int): Number of time steps
+            integrator (str): Integration method, one of reaction.INTEGRATORS (default: 'lsoda')
             
         Returns:
-            Tuple[List[float], Dict]: Time points and concentration data
+            Tuple[np.ndarray, Dict]: Time points and concentration data
         """
         if not self.reactions:
             raise ValueError("No reactions defined. Add reactions before simulating.")
         
         # Create time points
-        time_points = np.linspace(0, time_end, time_steps).tolist()
+        time_points = np.linspace(0, time_end, time_steps)
+        
+        # Create reaction system and gather its initial concentrations by index
+        reaction_system = ReactionSystem(self.reactions)
+        columns = [self._index[compound.formula] for compound in reaction_system.all_compounds]
+        C = reaction_system.integrate(self._conc[columns], time_points, integrator)
+        
+        results = {compound: C[:, i] for i, compound in enumerate(reaction_system.all_compounds)}
+        return time_points, results
+    
+    def simulate_batch(self, y0_batch: np.ndarray, time_end: float,
+                       time_steps: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate all reactions for many initial concentration sets using Euler's method.
+        
+        Args:
+            y0_batch (np.ndarray): Initial concentrations, shape (B, number of compounds),
+                with columns in the order compounds were added
+            time_end (float): End time for simulation (seconds)
+            time_steps (int): Number of time steps
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Time points and concentrations with shape
+                (B, time_steps, number of compounds), columns ordered as y0_batch
+        """
+        if not self.reactions:
+            raise ValueError("No reactions defined. Add reactions before simulating.")
+        
+        y0_batch = np.asarray(y0_batch, dtype=np.float64)
+        if y0_batch.ndim != 2 or y0_batch.shape[1] != len(self._compounds_list):
+            raise ValueError(f"y0_batch must have shape (B, {len(self._compounds_list)})")
         
-        # Prepare initial concentrations
-        initial_concentrations = {}
-        for formula, data in self.compounds.items():
-            initial_concentrations[data['compound']] = data['concentration']
+        time_points = np.linspace(0, time_end, time_steps)
         
-        # Create reaction system and simulate
         reaction_system = ReactionSystem(self.reactions)
-        results = reaction_system.simulate(initial_concentrations, time_points)
+        columns = [self._index[compound.formula] for compound in reaction_system.all_compounds]
+        
+        # Compounds outside every reaction keep their initial concentration
+        results = np.repeat(y0_batch[:, None, :], time_steps, axis=1)
+        results[:, :, columns] = reaction_system.integrate_batch(y0_batch[:, columns], time_points)
         
         return time_points, results
     
-    def plot_results(self, time_points: List[float], concentrations: Dict, 
+    def plot_results(self, time_points: np.ndarray, concentrations: Dict, 
                     output_file: str = None):
         """
         Plot the concentration vs time results.
         
         Args:
-            time_points (List[float]): Time points
+            time_points (np.ndarray): Time points
             concentrations (Dict): Concentration data
             output_file (str): Optional output file for saving plot
         """
-        plt.figure(figsize=(10, 6))
+        if output_file:
+            # Render off-screen without touching pyplot's global state or GUI backends
+            fig = Figure(figsize=(10, 6))
+            FigureCanvasAgg(fig)
+        else:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10, 6))
         
-        for compound, conc_data in concentrations.items():
-            plt.plot(time_points, conc_data, label=str(compound), linewidth=2)
+        ax = fig.add_subplot(1, 1, 1)
+        # Plot every compound in a single call, one column per compound
+        Y = np.column_stack(list(concentrations.values()))
+        ax.plot(time_points, Y, linewidth=2)
         
-        plt.xlabel('Time (s)')
-        plt.ylabel('Concentration (mol/L)')
-        plt.title('Chemical Reaction Simulation')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Concentration (mol/L)')
+        ax.set_title('Chemical Reaction Simulation')
+        ax.legend([str(compound) for compound in concentrations])
+        ax.grid(True, alpha=0.3)
         
         if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            fig.savefig(output_file, dpi=300, bbox_inches='tight')
             print(f"Plot saved to {output_file}")
         else:
             plt.show()
@@ -176,10 +260,8 @@ class ChemicalCalculator:
     def print_system_info(self):
         """Print information about the current system."""
         print("\n=== Chemical Reaction System ===")
-        print(f"Compounds ({len(self.compounds)}):")
-        for formula, data in self.compounds.items():
-            compound = data['compound']
-            concentration = data['concentration']
+        print(f"Compounds ({len(self._compounds_list)}):")
+        for compound, concentration in zip(self._compounds_list, self._conc):
             molar_mass = compound.calculate_molar_mass()
             print(f"  {compound} - {concentration:.3f} mol/L - MW: {molar_mass:.2f} g/mol")
         
@@ -224,6 +306,8 @@ def main():
                        help='Simulation time (seconds, default: 100)')
     parser.add_argument('--steps', '-s', type=int, default=1000,
                        help='Number of time steps (default: 1000)')
+    parser.add_argument('--integrator', '-i', choices=INTEGRATORS, default='lsoda',
+                       help='Integration method (default: lsoda)')
     parser.add_argument('--output', '-o', type=str, 
                        help='Output file for plot (optional)')
     parser.add_argument('--example', action='store_true',
@@ -250,9 +334,10 @@ def main():
     calculator.print_system_info()
     
     # Run simulation
-    print(f"\nRunning simulation for {args.time} seconds with {args.steps} steps...")
+    print(f"\nRunning simulation for {args.time} seconds with {args.steps} steps ({args.integrator})...")
     try:
-        time_points, concentrations = calculator.simulate_reactions(args.time, args.steps)
+        time_points, concentrations = calculator.simulate_reactions(args.time, args.steps,
+                                                                    args.integrator)
         
         # Print final concentrations
         print("\nFinal concentrations:")
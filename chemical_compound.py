@@ -5,15 +5,82 @@ This module defines the ChemicalCompound class for representing chemical compoun
 and their properties in reaction calculations.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 import re
 
 
+# Simplified atomic masses (g/mol)
+ATOMIC_MASSES = {
+    'H': 1.008, 'He': 4.003, 'Li': 6.94, 'Be': 9.012, 'B': 10.81,
+    'C': 12.01, 'N': 14.01, 'O': 16.00, 'F': 19.00, 'Ne': 20.18,
+    'Na': 22.99, 'Mg': 24.31, 'Al': 26.98, 'Si': 28.09, 'P': 30.97,
+    'S': 32.06, 'Cl': 35.45, 'Ar': 39.95, 'K': 39.10, 'Ca': 40.08,
+    'I': 126.90
+}
+
+# Simple regex to parse chemical formulas like H2O, C6H12O6, etc.
+_FORMULA_RE = re.compile(r'([A-Z][a-z]?)(\d*)')
+
+
+@lru_cache(maxsize=4096)
+def _parse_formula_cached(formula: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Parse a chemical formula into (element, count) pairs, memoized per formula.
+    
+    Args:
+        formula (str): Chemical formula (e.g., 'H2O')
+        
+    Returns:
+        Tuple[Tuple[str, int], ...]: Element composition as hashable pairs
+    """
+    matches = _FORMULA_RE.findall(formula)
+    composition = {element: int(count) if count else 1 for element, count in matches}
+    return tuple(composition.items())
+
+
+@lru_cache(maxsize=4096)
+def _molar_mass_cached(formula: str) -> float:
+    """
+    Calculate the molar mass of a formula from atomic masses, memoized per formula.
+    
+    Args:
+        formula (str): Chemical formula
+        
+    Returns:
+        float: Molar mass in g/mol
+    """
+    composition = dict(_parse_formula_cached(formula))
+    
+    # For generic compounds (like A, B, C in examples), assign a default mass
+    if len(composition) == 1 and len(list(composition.keys())[0]) == 1:
+        element = list(composition.keys())[0]
+        if element not in ATOMIC_MASSES and element.isalpha():
+            # Generic compound, assign default mass of 100 g/mol
+            return 100.0
+    
+    total_mass = 0.0
+    for element, count in composition.items():
+        if element in ATOMIC_MASSES:
+            total_mass += ATOMIC_MASSES[element] * count
+        else:
+            # For unknown elements in complex formulas, assign default atomic mass
+            if element.isalpha():
+                total_mass += 100.0 * count  # Default atomic mass
+            else:
+                raise ValueError(f"Unknown element: {element}")
+    
+    return total_mass
+
+
 class ChemicalCompound:
     """
     Represents a chemical compound with its molecular formula and properties.
     """
     
+    # Compounds are used as dict keys throughout; slots keep instances small
+    __slots__ = ('formula', 'name', 'molar_mass', 'composition')
+    
     def __init__(self, formula: str, name: str = None, molar_mass: float = None):
         """
         Initialize a chemical compound.
@@ -30,14 +97,7 @@ class ChemicalCompound:
     
     def _parse_formula(self):
         """Parse the chemical formula to extract element composition."""
-        # Simple regex to parse chemical formulas like H2O, C6H12O6, etc.
-        pattern = r'([A-Z][a-z]?)(\d*)'
-        matches = re.findall(pattern, self.formula)
-        
-        self.composition = {}
-        for element, count in matches:
-            count = int(count) if count else 1
-            self.composition[element] = count
+        self.composition = dict(_parse_formula_cached(self.formula))
     
     def calculate_molar_mass(self) -> float:
         """
@@ -46,39 +106,11 @@ class ChemicalCompound:
         Returns:
             float: Molar mass in g/mol
         """
-        # Simplified atomic masses (g/mol)
-        atomic_masses = {
-            'H': 1.008, 'He': 4.003, 'Li': 6.94, 'Be': 9.012, 'B': 10.81,
-            'C': 12.01, 'N': 14.01, 'O': 16.00, 'F': 19.00, 'Ne': 20.18,
-            'Na': 22.99, 'Mg': 24.31, 'Al': 26.98, 'Si': 28.09, 'P': 30.97,
-            'S': 32.06, 'Cl': 35.45, 'Ar': 39.95, 'K': 39.10, 'Ca': 40.08,
-            'I': 126.90
-        }
-        
         if self.molar_mass is not None:
             return self.molar_mass
         
-        # For generic compounds (like A, B, C in examples), assign a default mass
-        if len(self.composition) == 1 and len(list(self.composition.keys())[0]) == 1:
-            element = list(self.composition.keys())[0]
-            if element not in atomic_masses and element.isalpha():
-                # Generic compound, assign default mass of 100 g/mol
-                self.molar_mass = 100.0
-                return self.molar_mass
-        
-        total_mass = 0.0
-        for element, count in self.composition.items():
-            if element in atomic_masses:
-                total_mass += atomic_masses[element] * count
-            else:
-                # For unknown elements in complex formulas, assign default atomic mass
-                if element.isalpha():
-                    total_mass += 100.0 * count  # Default atomic mass
-                else:
-                    raise ValueError(f"Unknown element: {element}")
-        
-        self.molar_mass = total_mass
-        return total_mass
+        self.molar_mass = _molar_mass_cached(self.formula)
+        return self.molar_mass
     
     def __str__(self):
         return f"{self.name} ({self.formula})"
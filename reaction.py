@@ -5,10 +5,340 @@ This module defines classes for representing chemical reactions and calculating
 reaction kinetics over time.
 """
 
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
 import math
+import numpy as np
+from scipy.integrate import odeint
 from chemical_compound import ChemicalCompound
 
+try:
+    import numba
+except ImportError:  # numba is optional; fall back to the NumPy integrator
+    numba = None
+
+try:
+    import numbalsoda
+except ImportError:  # numbalsoda is optional; only needed for integrator='numbalsoda'
+    numbalsoda = None
+
+
+def _euler_numpy(C0: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                 k: np.ndarray, dts: np.ndarray) -> np.ndarray:
+    """
+    Integrate the system with Euler's method using vectorized NumPy steps.
+    
+    Args:
+        C0 (np.ndarray): Initial concentrations, shape (N,)
+        S (np.ndarray): Stoichiometry matrix, shape (R, N)
+        idx (np.ndarray): Reactant compound indices, shape (R, M), padded with 0
+        order (np.ndarray): Reactant orders matching idx, shape (R, M), padded with 0.0
+        k (np.ndarray): Rate constants, shape (R,)
+        dts (np.ndarray): Step sizes, shape (T-1,)
+        
+    Returns:
+        np.ndarray: Concentrations at each time point, shape (T, N)
+    """
+    C = np.empty((dts.size + 1, C0.size))
+    C[0] = C0
+    # Work buffers reused by every step, so the loop allocates nothing
+    factors = np.empty(idx.shape)
+    rates = np.empty(k.size)
+    step = np.empty(C0.size)
+    for i in range(1, dts.size + 1):
+        np.take(C[i-1], idx, out=factors)
+        np.power(factors, order, out=factors)
+        np.prod(factors, axis=1, out=rates)
+        np.multiply(rates, k, out=rates)
+        np.matmul(rates, S, out=step)
+        np.multiply(step, dts[i-1], out=step)
+        np.add(step, C[i-1], out=step)
+        # Ensure concentrations don't go negative, writing straight into the result
+        np.maximum(step, 0.0, out=C[i])
+    return C
+
+
+def _euler_fill_loops(C: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                      k: np.ndarray, dts: np.ndarray):
+    """
+    Integrate the system with Euler's method into a caller-provided array.
+    
+    Same arguments as _euler_numpy, except the initial concentrations are
+    read from C[0] and rows 1 to T-1 of the (T, N) array C are filled in place.
+    Written for compilation with numba, both plain and with parallel=True: each
+    reaction only writes its own rate and each compound only its own update, so
+    the numba.prange loops are independent (and run as range when not parallel).
+    """
+    n_compounds = C.shape[1]
+    n_reactions, n_slots = idx.shape
+    rates = np.empty(n_reactions)
+    for i in range(1, dts.size + 1):
+        for r in numba.prange(n_reactions):
+            # Padded slots have order 0 and contribute a factor of 1, so there is
+            # no branch on the slot count; an exhausted reactant zeroes the rate
+            rate = k[r]
+            for slot in range(n_slots):
+                rate *= C[i-1, idx[r, slot]] ** order[r, slot]
+            rates[r] = rate
+        for j in numba.prange(n_compounds):
+            v = C[i-1, j]
+            for r in range(n_reactions):
+                v += dts[i-1] * S[r, j] * rates[r]
+            # Ensure concentrations don't go negative
+            C[i, j] = max(0.0, v)
+
+
+def _euler_fill_parallel_loops(C: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                               k: np.ndarray, dts: np.ndarray):
+    """
+    _euler_fill_loops under its own name, for the parallel=True build.
+    
+    numba keys its disk cache on the Python function, so compiling
+    _euler_fill_loops both ways would let each build load the other's cached
+    code. The loops are inlined here so their prange still runs in parallel.
+    """
+    _euler_fill_inline(C, S, idx, order, k, dts)
+
+
+def _euler_compiled(C0: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                    k: np.ndarray, dts: np.ndarray, parallel: bool = False) -> np.ndarray:
+    """
+    Integrate the system with Euler's method using the compiled fill kernel.
+    
+    Same contract as _euler_numpy, plus parallel to select the prange-parallel
+    compilation; only used when numba is installed.
+    """
+    C = np.empty((dts.size + 1, C0.size))
+    C[0] = C0
+    fill = _euler_fill_parallel if parallel else _euler_fill
+    fill(C, S, idx, order, k, dts)
+    return C
+
+
+def _jacobian_loops(y: np.ndarray, S: np.ndarray, O: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the analytic Jacobian of the mass-action rate equations using scalar loops.
+    
+    J[i, j] = sum_r S[r, i] * k[r] * O[r, j] * y[j]**(O[r, j]-1) * prod_{m != j} y[m]**O[r, m]
+    
+    Args:
+        y (np.ndarray): Concentrations, shape (N,)
+        S (np.ndarray): Stoichiometry matrix, shape (R, N)
+        O (np.ndarray): Reactant-order matrix, shape (R, N)
+        k (np.ndarray): Rate constants, shape (R,)
+        
+    Returns:
+        np.ndarray: Jacobian matrix, shape (N, N)
+    """
+    n_compounds = y.size
+    n_reactions = k.size
+    J = np.zeros((n_compounds, n_compounds))
+    for r in range(n_reactions):
+        for j in range(n_compounds):
+            o = O[r, j]
+            # The rate equations clamp y[j] to zero, so below zero they are flat in y[j]
+            if o == 0.0 or y[j] < 0.0:
+                continue
+            # The product over m != j is taken explicitly so y[j] == 0 needs no guard
+            drate = k[r] * o * y[j] ** (o - 1.0)
+            for m in range(n_compounds):
+                if m != j and O[r, m] != 0.0:
+                    drate *= max(y[m], 0.0) ** O[r, m]
+            for i in range(n_compounds):
+                J[i, j] += S[r, i] * drate
+    return J
+
+
+def _rhs_loops(y: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+               k: np.ndarray, dy: np.ndarray):
+    """
+    Evaluate the rate of change of every compound into dy using scalar loops.
+    
+    Args:
+        y (np.ndarray): Concentrations, shape (N,)
+        S (np.ndarray): Stoichiometry matrix, shape (R, N)
+        idx (np.ndarray): Reactant compound indices, shape (R, M), padded with 0
+        order (np.ndarray): Reactant orders matching idx, shape (R, M), padded with 0.0
+        k (np.ndarray): Rate constants, shape (R,)
+        dy (np.ndarray): Output rate of change, shape (N,)
+    """
+    n_compounds = y.size
+    n_reactions, n_slots = idx.shape
+    for j in range(n_compounds):
+        dy[j] = 0.0
+    for r in range(n_reactions):
+        rate = k[r]
+        for slot in range(n_slots):
+            rate *= max(y[idx[r, slot]], 0.0) ** order[r, slot]
+        for j in range(n_compounds):
+            dy[j] += S[r, j] * rate
+
+
+if numba is not None:
+    _rhs_kernel = numba.njit(cache=True, fastmath=True, boundscheck=False)(_rhs_loops)
+    _euler_fill = numba.njit(cache=True, fastmath=True, boundscheck=False)(_euler_fill_loops)
+    _euler_fill_inline = numba.njit(inline='always', fastmath=True, boundscheck=False)(_euler_fill_loops)
+    _euler_fill_parallel = numba.njit(parallel=True, cache=True, fastmath=True,
+                                      boundscheck=False)(_euler_fill_parallel_loops)
+    _simulate_euler = _euler_compiled
+    _jacobian_kernel = numba.njit(cache=True, fastmath=True, boundscheck=False)(_jacobian_loops)
+else:
+    _rhs_kernel = None
+    _euler_fill = None
+    _euler_fill_inline = None
+    _euler_fill_parallel = None
+    _simulate_euler = _euler_numpy
+    _jacobian_kernel = None
+
+
+def _euler_batch_numpy(C0: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                       k: np.ndarray, time_points: np.ndarray) -> np.ndarray:
+    """
+    Integrate a batch of initial conditions with Euler's method, one at a time.
+    
+    Args:
+        C0 (np.ndarray): Initial concentrations, shape (B, N)
+        S (np.ndarray): Stoichiometry matrix, shape (R, N)
+        idx (np.ndarray): Reactant compound indices, shape (R, M), padded with 0
+        order (np.ndarray): Reactant orders matching idx, shape (R, M), padded with 0.0
+        k (np.ndarray): Rate constants, shape (R,)
+        time_points (np.ndarray): Time points, shape (T,)
+        
+    Returns:
+        np.ndarray: Concentrations for each trajectory, shape (B, T, N)
+    """
+    dts = np.diff(time_points)
+    return np.stack([_euler_numpy(y0, S, idx, order, k, dts) for y0 in C0])
+
+
+def _euler_batch_loops(C0: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                       k: np.ndarray, dts: np.ndarray, time_points: np.ndarray, C: np.ndarray):
+    """
+    Integrate one trajectory of a batch into C; the kernel body for numba.guvectorize.
+    
+    Same arguments as _euler_fill_loops for a single (N,) initial state, with the
+    (T, N) output passed in as C. time_points is only read by guvectorize to size C.
+    """
+    for j in range(C0.size):
+        C[0, j] = C0[j]
+    _euler_fill(C, S, idx, order, k, dts)
+
+
+_euler_batch_kernel = None
+
+
+def _simulate_euler_batch(C0: np.ndarray, S: np.ndarray, idx: np.ndarray, order: np.ndarray,
+                          k: np.ndarray, time_points: np.ndarray) -> np.ndarray:
+    """
+    Integrate a batch of initial conditions with Euler's method.
+    
+    With numba installed this is a guvectorized kernel parallelized over the
+    batch; it is compiled on first use so importing this module stays cheap.
+    Otherwise each trajectory is integrated in turn with NumPy.
+    """
+    global _euler_batch_kernel
+    if numba is None:
+        return _euler_batch_numpy(C0, S, idx, order, k, time_points)
+    
+    if _euler_batch_kernel is None:
+        signature = [(numba.float64[:], numba.float64[:, :], numba.int32[:, :],
+                      numba.float64[:, :], numba.float64[:], numba.float64[:],
+                      numba.float64[:], numba.float64[:, :])]
+        _euler_batch_kernel = numba.guvectorize(
+            signature, '(n),(r,n),(r,m),(r,m),(r),(s),(t)->(t,n)',
+            nopython=True, target='parallel')(_euler_batch_loops)
+    # Step sizes are shared by every trajectory, so compute them once
+    dts = np.diff(time_points)
+    return _euler_batch_kernel(C0, S, idx, order, k, dts, time_points)
+
+
+def _pack_lsoda_data(S: np.ndarray, idx: np.ndarray, order: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """
+    Pack a system into the flat float64 data array read by _lsoda_rhs_loops.
+    
+    Layout: [R, N, M, S (R*N), idx (R*M), order (R*M), k (R)], all row-major.
+    
+    Returns:
+        np.ndarray: Packed data, shape (3 + R*N + 2*R*M + R,)
+    """
+    n_reactions, n_compounds = S.shape
+    n_slots = idx.shape[1]
+    return np.concatenate(([n_reactions, n_compounds, n_slots], S.ravel(), idx.ravel(),
+                           order.ravel(), k)).astype(np.float64)
+
+
+def _lsoda_rhs_loops(t, y_ptr, dy_ptr, data_ptr):
+    """
+    Evaluate the rate equations from raw pointers; the body of the numbalsoda callback.
+    
+    The whole system arrives through data_ptr as packed by _pack_lsoda_data, so
+    one compiled callback serves every ReactionSystem.
+    """
+    header = numba.carray(data_ptr, (3,))
+    n_reactions, n_compounds, n_slots = int(header[0]), int(header[1]), int(header[2])
+    data = numba.carray(data_ptr, (3 + n_reactions * (n_compounds + 2 * n_slots + 1),))
+    y = numba.carray(y_ptr, (n_compounds,))
+    dy = numba.carray(dy_ptr, (n_compounds,))
+    S_start = 3
+    idx_start = S_start + n_reactions * n_compounds
+    order_start = idx_start + n_reactions * n_slots
+    k_start = order_start + n_reactions * n_slots
+    for j in range(n_compounds):
+        dy[j] = 0.0
+    for r in range(n_reactions):
+        rate = data[k_start + r]
+        for slot in range(n_slots):
+            j = int(data[idx_start + r * n_slots + slot])
+            rate *= max(y[j], 0.0) ** data[order_start + r * n_slots + slot]
+        for j in range(n_compounds):
+            dy[j] += data[S_start + r * n_compounds + j] * rate
+
+
+_lsoda_rhs = None
+
+
+def _get_lsoda_rhs():
+    """
+    Return the numbalsoda callback, compiling it (or loading it from numba's cache) on first use.
+    
+    Returns:
+        numba.core.ccallback.CFunc: Callback with signature numbalsoda.lsoda_sig;
+            pass its .address to numbalsoda.lsoda with data from _pack_lsoda_data
+    """
+    global _lsoda_rhs
+    if numba is None or numbalsoda is None:
+        raise ImportError("The 'numbalsoda' integrator requires the numba and numbalsoda packages")
+    if _lsoda_rhs is None:
+        _lsoda_rhs = numba.cfunc(numbalsoda.lsoda_sig, cache=True, fastmath=True,
+                                 boundscheck=False)(_lsoda_rhs_loops)
+    return _lsoda_rhs
+
+
+# Up to this many reactions the generated plain-Python rate equations beat the
+# NumPy and compiled kernels, since odeint's Python callback dominates each call
+CODEGEN_MAX_REACTIONS = 32
+
+# Below this many reactions the thread start-up per step outweighs the parallel Euler kernel
+PARALLEL_MIN_REACTIONS = 64
+
+@lru_cache(maxsize=64)
+def _compile_rhs_source(source: str) -> Callable[[float, np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Compile generated rate-equation source, memoized per source string.
+    
+    Args:
+        source (str): Source defining rhs(t, y, k), as emitted by ReactionSystem._codegen_rhs
+        
+    Returns:
+        Callable[[float, np.ndarray, np.ndarray], np.ndarray]: The compiled rhs function
+    """
+    namespace = {'np': np}
+    exec(source, namespace)
+    return namespace['rhs']
+
+# Integration methods accepted by ReactionSystem.simulate
+INTEGRATORS = ('lsoda', 'numbalsoda', 'euler')
+
 
 class Reaction:
     """
@@ -96,51 +426,277 @@ class ReactionSystem:
             reactions (List[Reaction]): List of reactions in the system
         """
         self.reactions = reactions
-        self.all_compounds = set()
+        self.all_compounds = []
         
-        # Collect all compounds from all reactions
+        # Collect all compounds from all reactions (in first-seen order)
+        seen = set()
         for reaction in reactions:
-            self.all_compounds.update(reaction.reactants.keys())
-            self.all_compounds.update(reaction.products.keys())
+            for compound in list(reaction.reactants) + list(reaction.products):
+                if compound not in seen:
+                    seen.add(compound)
+                    self.all_compounds.append(compound)
+        
+        self.compound_index = {compound: i for i, compound in enumerate(self.all_compounds)}
+        
+        # Precompute the stoichiometry matrix S, the reactant-order matrix O and
+        # the rate-constant vector k, each indexed by (reaction, compound)
+        n_reactions = len(reactions)
+        n_compounds = len(self.all_compounds)
+        self.S = np.zeros((n_reactions, n_compounds))
+        self.O = np.zeros((n_reactions, n_compounds))
+        self.k = np.zeros(n_reactions)
+        
+        for r, reaction in enumerate(reactions):
+            self.k[r] = reaction.rate_constant
+            for compound, coeff in reaction.reactants.items():
+                idx = self.compound_index[compound]
+                self.O[r, idx] = coeff
+                self.S[r, idx] -= coeff
+            for compound, coeff in reaction.products.items():
+                self.S[r, self.compound_index[compound]] += coeff
+        
+        # Reactant indices and orders per reaction, padded to the widest reaction
+        # with (index 0, order 0) so rate kernels only visit actual reactants
+        n_slots = max([len(reaction.reactants) for reaction in reactions] + [1])
+        self.reactant_idx = np.zeros((n_reactions, n_slots), dtype=np.int32)
+        self.reactant_order = np.zeros((n_reactions, n_slots))
+        for r, reaction in enumerate(reactions):
+            for slot, (compound, coeff) in enumerate(reaction.reactants.items()):
+                self.reactant_idx[r, slot] = self.compound_index[compound]
+                self.reactant_order[r, slot] = coeff
+        
+        self.rhs_fn = self.build_rhs()
+        self.jac_fn = self.build_jacobian()
     
-    def simulate(self, initial_concentrations: Dict[ChemicalCompound, float], 
-                 time_points: List[float]) -> Dict[ChemicalCompound, List[float]]:
+    def _rhs(self, t: float, y: np.ndarray, k: np.ndarray = None) -> np.ndarray:
         """
-        Simulate the reaction system over time using Euler's method.
+        Evaluate the rate of change of every compound (dc/dt).
         
         Args:
-            initial_concentrations (Dict[ChemicalCompound, float]): Initial concentrations in mol/L
-            time_points (List[float]): Time points to simulate (in seconds)
+            t (float): Time (unused, the system is autonomous)
+            y (np.ndarray): Concentrations in mol/L
+            k (np.ndarray, optional): Rate constants (default: the system's k)
             
         Returns:
-            Dict[ChemicalCompound, List[float]]: Concentrations at each time point
-        """
-        # Initialize concentration arrays
-        concentrations = {}
-        for compound in self.all_compounds:
-            concentrations[compound] = [initial_concentrations.get(compound, 0.0)]
-        
-        # Simple Euler integration
-        for i in range(1, len(time_points)):
-            dt = time_points[i] - time_points[i-1]
-            current_conc = {compound: concentrations[compound][-1] 
-                           for compound in self.all_compounds}
+            np.ndarray: Rate of change of each concentration in mol/L/s
+        """
+        k = self.k if k is None else k
+        y = np.maximum(y, 0.0)
+        rates = k * np.prod(np.power(y[self.reactant_idx], self.reactant_order), axis=1)
+        return rates @ self.S
+    
+    def _jac(self, t: float, y: np.ndarray, k: np.ndarray = None) -> np.ndarray:
+        """
+        Evaluate the analytic Jacobian of the rate of change, J[i, j] = d(dc_i/dt)/dc_j.
+        
+        Args:
+            t (float): Time (unused, the system is autonomous)
+            y (np.ndarray): Concentrations in mol/L
+            k (np.ndarray, optional): Rate constants (default: the system's k)
             
-            # Calculate rate of change for each compound
-            rate_changes = {compound: 0.0 for compound in self.all_compounds}
+        Returns:
+            np.ndarray: Jacobian matrix, shape (N, N)
+        """
+        k = self.k if k is None else k
+        # The rate equations clamp y to zero, so they are flat in any negative y_j
+        active = y >= 0.0
+        y = np.maximum(y, 0.0)
+        n_compounds = y.size
+        powers = np.power(y, self.O)
+        # d(y_j ** O_rj)/dy_j, which is zero wherever compound j is not a reactant
+        dpowers = self.O * np.power(y, np.maximum(self.O - 1.0, 0.0)) * active
+        
+        # Product over m != j of y_m ** O_rm, shape (R, N)
+        others = np.repeat(powers[:, None, :], n_compounds, axis=1)
+        others[:, np.arange(n_compounds), np.arange(n_compounds)] = 1.0
+        drates = k[:, None] * dpowers * np.prod(others, axis=2)
+        
+        return self.S.T @ drates
+    
+    def _codegen_rhs(self) -> Callable[[float, np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Generate rate equations specialized to this system's fixed stoichiometry.
+        
+        Emits Python source with one explicit product per reaction, e.g.
+        r0 = k[0]*c0*c1, so first and second order terms become plain
+        multiplications. Rate constants stay an argument, so the source depends
+        only on S and O and systems with the same structure share one function.
+        The result is plain Python: a numba compile of exec'd source cannot be
+        cached to disk and costs far more than it saves under odeint.
+        
+        Returns:
+            Callable[[float, np.ndarray, np.ndarray], np.ndarray]: Function rhs(t, y, k) returning dc/dt
+        """
+        n_reactions, n_compounds = self.S.shape
+        lines = ["def rhs(t, y, k):"]
+        
+        # Clamp each reactant concentration once, as _rhs does
+        for j in sorted({int(j) for j in np.nonzero(self.O)[1]}):
+            lines.append(f"    c{j} = max(y[{j}], 0.0)")
+        
+        for r in range(n_reactions):
+            factors = [f"k[{r}]"]
+            for j in np.nonzero(self.O[r])[0]:
+                o = self.O[r, j]
+                if o == 1:
+                    factors.append(f"c{j}")
+                elif o == 2:
+                    factors.append(f"c{j}*c{j}")
+                elif o == int(o):
+                    factors.append(f"c{j}**{int(o)}")
+                else:
+                    factors.append(f"c{j}**{float(o)!r}")
+            lines.append(f"    r{r} = " + "*".join(factors))
+        
+        rows = []
+        for j in range(n_compounds):
+            expr = ""
+            for r in np.nonzero(self.S[:, j])[0]:
+                coeff = self.S[r, j]
+                term = f"r{r}" if abs(coeff) == 1 else f"{abs(float(coeff))!r}*r{r}"
+                if coeff < 0:
+                    expr += f" - {term}" if expr else f"-{term}"
+                else:
+                    expr += f" + {term}" if expr else term
+            rows.append(expr or "0.0")
+        lines.append("    return np.array([" + ", ".join(rows) + "])")
+        
+        return _compile_rhs_source("\n".join(lines) + "\n")
+    
+    def build_rhs(self) -> Callable[[float, np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Build the rate-equation function used by the 'lsoda' integrator.
+        
+        Small systems get generated rate equations (_codegen_rhs); larger ones
+        use the compiled kernel when numba is installed, otherwise the
+        vectorized NumPy version (_rhs).
+        
+        Returns:
+            Callable[[float, np.ndarray, np.ndarray], np.ndarray]: Function rhs(t, y, k) returning dc/dt
+        """
+        if self.k.size <= CODEGEN_MAX_REACTIONS:
+            return self._codegen_rhs()
+        if _rhs_kernel is None:
+            return self._rhs
+        
+        S, idx, order = self.S, self.reactant_idx, self.reactant_order
+        
+        def rhs(t: float, y: np.ndarray, k: np.ndarray) -> np.ndarray:
+            dy = np.empty(y.size)
+            _rhs_kernel(y, S, idx, order, k, dy)
+            return dy
+        
+        return rhs
+    
+    def build_jacobian(self) -> Callable[..., np.ndarray]:
+        """
+        Build the analytic Jacobian function for this system.
+        
+        With numba installed the Jacobian is evaluated by a compiled kernel over
+        the system's S, O and k matrices; otherwise the vectorized NumPy version
+        (_jac) is returned.
+        
+        Returns:
+            Callable[..., np.ndarray]: Function jac(t, y, k=None) returning an (N, N) matrix,
+                using the system's rate constants when k is omitted
+        """
+        if _jacobian_kernel is None:
+            return self._jac
+        
+        S, O = self.S, self.O
+        
+        def jac(t: float, y: np.ndarray, k: np.ndarray = None) -> np.ndarray:
+            return _jacobian_kernel(y, S, O, self.k if k is None else k)
+        
+        return jac
+    
+    def integrate(self, y0: np.ndarray, time_points: np.ndarray,
+                  integrator: str = 'lsoda') -> np.ndarray:
+        """
+        Integrate the system from an initial concentration vector.
+        
+        The default 'lsoda' integrator adapts its step size and switches between
+        Adams and BDF methods for stiff systems, so the time points only control
+        where results are reported. 'numbalsoda' runs the same LSODA algorithm
+        entirely in compiled code (requires numba and numbalsoda), which avoids
+        the per-step Python callback overhead on small systems. 'euler' uses
+        fixed steps between time points; with numba, systems of at least
+        PARALLEL_MIN_REACTIONS reactions evaluate their rates in parallel.
+        
+        Negative concentrations are clamped to zero: once on the returned
+        trajectory for the adaptive integrators, and after every step for
+        'euler', where the clamp feeds back into later steps. The clamp only
+        masks integration error; if it changes results noticeably, use an
+        adaptive integrator (whose atol is set low) or more time steps.
+        
+        Args:
+            y0 (np.ndarray): Initial concentrations in mol/L, ordered as all_compounds
+            time_points (np.ndarray): Time points to simulate (in seconds)
+            integrator (str): Integration method, one of INTEGRATORS (default: 'lsoda')
+            
+        Returns:
+            np.ndarray: Concentrations with shape (len(time_points), len(all_compounds))
+        """
+        C0 = np.ascontiguousarray(y0, dtype=np.float64)
+        time_points = np.asarray(time_points, dtype=np.float64)
+        
+        if integrator == 'lsoda':
+            C = odeint(self.rhs_fn, C0, time_points, args=(self.k,), Dfun=self.jac_fn, tfirst=True,
+                       rtol=1e-8, atol=1e-10)
+            # Ensure concentrations don't go negative
+            C = np.maximum(C, 0.0)
+        elif integrator == 'numbalsoda':
+            data = _pack_lsoda_data(self.S, self.reactant_idx, self.reactant_order, self.k)
+            C, success = numbalsoda.lsoda(_get_lsoda_rhs().address, C0, time_points,
+                                          data=data, rtol=1e-8, atol=1e-10)
+            if not success:
+                raise RuntimeError("numbalsoda integration failed")
+            C = np.maximum(C, 0.0)
+        elif integrator == 'euler':
+            # Step sizes are computed once as an array for the kernel
+            dts = np.diff(time_points)
+            if numba is not None and self.k.size >= PARALLEL_MIN_REACTIONS:
+                C = _euler_compiled(C0, self.S, self.reactant_idx, self.reactant_order, self.k,
+                                    dts, parallel=True)
+            else:
+                C = _simulate_euler(C0, self.S, self.reactant_idx, self.reactant_order, self.k, dts)
+        else:
+            raise ValueError(f"Unknown integrator: {integrator}")
+        
+        return C
+    
+    def integrate_batch(self, y0_batch: np.ndarray, time_points: np.ndarray) -> np.ndarray:
+        """
+        Integrate many initial conditions at once with Euler's method.
+        
+        With numba installed the trajectories run in parallel across CPU cores.
+        
+        Args:
+            y0_batch (np.ndarray): Initial concentrations in mol/L, shape (B, N), ordered as all_compounds
+            time_points (np.ndarray): Time points to simulate (in seconds)
             
-            for reaction in self.reactions:
-                reaction_rate = reaction.calculate_rate(current_conc)
-                stoichiometry = reaction.get_stoichiometry_matrix()
-                
-                for compound, stoich_coeff in stoichiometry.items():
-                    rate_changes[compound] += stoich_coeff * reaction_rate
+        Returns:
+            np.ndarray: Concentrations with shape (B, len(time_points), len(all_compounds))
+        """
+        C0 = np.ascontiguousarray(y0_batch, dtype=np.float64)
+        time_points = np.asarray(time_points, dtype=np.float64)
+        return _simulate_euler_batch(C0, self.S, self.reactant_idx, self.reactant_order, self.k,
+                                     time_points)
+    
+    def simulate(self, initial_concentrations: Dict[ChemicalCompound, float], 
+                 time_points: np.ndarray,
+                 integrator: str = 'lsoda') -> Dict[ChemicalCompound, np.ndarray]:
+        """
+        Simulate the reaction system over time.
+        
+        Args:
+            initial_concentrations (Dict[ChemicalCompound, float]): Initial concentrations in mol/L
+            time_points (np.ndarray): Time points to simulate (in seconds)
+            integrator (str): Integration method, one of INTEGRATORS (default: 'lsoda')
             
-            # Update concentrations
-            for compound in self.all_compounds:
-                new_conc = current_conc[compound] + rate_changes[compound] * dt
-                # Ensure concentrations don't go negative
-                new_conc = max(0.0, new_conc)
-                concentrations[compound].append(new_conc)
-        
-        return concentrations
\ No newline at end of file
+        Returns:
+            Dict[ChemicalCompound, np.ndarray]: Concentrations at each time point
+        """
+        y0 = [initial_concentrations.get(compound, 0.0) for compound in self.all_compounds]
+        C = self.integrate(y0, time_points, integrator)
+        return {compound: C[:, i] for i, compound in enumerate(self.all_compounds)}
@@ -28,6 +28,10 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "jit": ["numba>=0.53.0"],
+        "numbalsoda": ["numba>=0.53.0", "numbalsoda"],
+    },
     entry_points={
         "console_scripts": [
             "chem-calculator=chem_calculator:main",
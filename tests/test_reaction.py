@@ -0,0 +1,64 @@
+"""Tests for the reaction system's rate equations and Jacobian."""
+
+import numpy as np
+import pytest
+
+from chem_calculator import ChemicalCalculator
+from reaction import ReactionSystem
+
+
+def _network() -> ReactionSystem:
+    """A + 2B -> C, C -> A + D, 3D -> B: mixed orders and a compound on both sides."""
+    calc = ChemicalCalculator()
+    for formula in 'ABCD':
+        calc.add_compound(formula, None, 1.0)
+    calc.add_reaction(['A', 'B'], [1, 2], ['C'], [1], 0.3)
+    calc.add_reaction(['C'], [1], ['A', 'D'], [1, 1], 0.2)
+    calc.add_reaction(['D'], [3], ['B'], [1], 0.05)
+    return ReactionSystem(calc.reactions)
+
+
+def _enzyme_network() -> ReactionSystem:
+    """E + S <-> ES -> E + P: reversible binding and a catalyst regenerated by the last step."""
+    calc = ChemicalCalculator()
+    calc.add_reaction(['E', 'S'], [1, 1], ['ES'], [1], 2.0)
+    calc.add_reaction(['ES'], [1], ['E', 'S'], [1, 1], 0.5)
+    calc.add_reaction(['ES'], [1], ['E', 'P'], [1, 1], 1.2)
+    return ReactionSystem(calc.reactions)
+
+
+def _autocatalytic_network() -> ReactionSystem:
+    """A + B -> 2B, 2A + 2B -> C, C -> C + D: net coefficients and a fourth-order reaction."""
+    calc = ChemicalCalculator()
+    calc.add_reaction(['A', 'B'], [1, 1], ['B'], [2], 0.8)
+    calc.add_reaction(['A', 'B'], [2, 2], ['C'], [1], 0.1)
+    calc.add_reaction(['C'], [1], ['C', 'D'], [1, 1], 0.4)
+    return ReactionSystem(calc.reactions)
+
+
+def _numeric_jacobian(system: ReactionSystem, y: np.ndarray, eps: float = 1e-7) -> np.ndarray:
+    columns = [(system._rhs(0.0, y + eps * e) - system._rhs(0.0, y - eps * e)) / (2 * eps)
+               for e in np.eye(y.size)]
+    return np.array(columns).T
+
+
+@pytest.mark.parametrize('y', [
+    [0.7, 1.3, 0.4, 0.9],
+    [0.7, -0.2, 0.4, -0.05],
+    [-0.3, 1.1, -0.1, 0.9],
+])
+def test_jacobian_matches_clamped_rhs(y):
+    system = _network()
+    y = np.array(y)
+    expected = _numeric_jacobian(system, y)
+    np.testing.assert_allclose(system._jac(0.0, y), expected, atol=1e-8)
+    np.testing.assert_allclose(system.jac_fn(0.0, y), expected, atol=1e-8)
+
+
+@pytest.mark.parametrize('build', [_network, _enzyme_network, _autocatalytic_network])
+def test_codegen_rhs_matches_rhs(build):
+    system = build()
+    rhs = system._codegen_rhs()
+    n_compounds = len(system.all_compounds)
+    for y in (np.linspace(0.5, 1.5, n_compounds), np.linspace(-0.4, 1.2, n_compounds)):
+        np.testing.assert_allclose(rhs(0.0, y, system.k), system._rhs(0.0, y), rtol=1e-12)